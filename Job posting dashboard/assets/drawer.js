@@ -0,0 +1,55 @@
+// Clientside drawer callbacks for main_dash.py (served automatically from /assets)
+function htmlComponent(type, children, props) {
+    return {
+        type: type,
+        namespace: "dash_html_components",
+        props: Object.assign({children: children}, props || {})
+    };
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    drawer: {
+        // Slide the drawer in with the selected row's details (bullets come pre-split from desc-store)
+        display: function (selectedRows, data, bullets, style) {
+            if (!selectedRows || !selectedRows.length || !data || !data.length) {
+                return [Object.assign({}, style, {right: "-40%"}), []];
+            }
+            const row = data[selectedRows[0]];
+            const field = name => row[name] ?? "N/A";
+
+            const parts = ((bullets || [])[row.id] || []).filter(part => part);
+            const descContent = parts.length
+                ? htmlComponent("Ul", parts.map(part => htmlComponent("Li", part)))
+                : htmlComponent("P", "No description available.");
+
+            const content = htmlComponent("Div", [
+                htmlComponent("Button", "❌ Close", {id: "close-drawer", style: {
+                    float: "right", background: "red", color: "white", border: "none",
+                    padding: "5px 10px", cursor: "pointer", borderRadius: "5px"
+                }}),
+
+                htmlComponent("H2", field("job_postings"), {style: {marginTop: "0px"}}),
+                htmlComponent("P", `📌 Company: ${field("company")}`, {style: {fontWeight: "bold"}}),
+                htmlComponent("P", `📍 Location: ${field("place")}`),
+                htmlComponent("P", `📝 Status: ${field("status")}`),
+                htmlComponent("P", `📅 Posted On: ${field("posted_on")}`),
+                htmlComponent("A", "🔗 View Job Posting", {
+                    href: row.url_link ?? "#", target: "_blank",
+                    style: {color: "blue", textDecoration: "underline"}
+                }),
+
+                htmlComponent("H3", "📄 Job Description", {style: {marginTop: "20px", borderBottom: "1px solid #ddd"}}),
+                descContent
+            ]);
+
+            return [Object.assign({}, style, {right: "0%"}), content];
+        },
+
+        close: function (nClicks, style) {
+            if (nClicks) {
+                return Object.assign({}, style, {right: "-40%"});
+            }
+            return style;
+        }
+    }
+});
@@ -0,0 +1,39 @@
+// Clientside callbacks for main_dash.py (served automatically from /assets)
+function escapeRegExp(text) {
+    return text.replace(/[.*+?^${}()|[\]\\]/g, "\\$&");
+}
+
+// Compiled keyword matcher, cached on the normalized term list so typing
+// spaces/commas (or re-ordering terms) doesn't rebuild it
+let keywordCache = {key: null, pattern: null};
+
+function keywordPattern(terms) {
+    const unique = [...new Set(terms.map(t => t.toLowerCase()))].sort();
+    const key = unique.join(",");
+    if (keywordCache.key !== key) {
+        // One case-insensitive alternation: a single pass over each description
+        keywordCache = {key: key, pattern: new RegExp(unique.map(escapeRegExp).join("|"), "i")};
+    }
+    return keywordCache.pattern;
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    filters: {
+        // Keyword filter: keep rows whose description contains any comma separated term
+        // (descriptions arrive pre-split on commas; terms never contain one)
+        applyKeyword: function (keywords, data, descriptions) {
+            if (!data) {
+                return [];
+            }
+            const terms = (keywords || "")
+                .split(",")
+                .map(k => k.trim())
+                .filter(k => k);
+            if (!terms.length) {
+                return data;
+            }
+            const pattern = keywordPattern(terms);
+            return data.filter(r => ((descriptions || [])[r.id] || []).some(part => pattern.test(part)));
+        }
+    }
+});
@@ -1,49 +1,86 @@
 import dash
-from dash import dcc, html, dash_table, Input, Output, State
+from dash import dcc, html, dash_table, Input, Output, State, ctx, ClientsideFunction
+from flask_caching import Cache
+import functools
 import pandas as pd
-import gspread
-from google.oauth2.service_account import Credentials
+import numpy as np
+from sheets_client import get_client, get_modified_time, get_sheet_values
 
 # ---------------- Google Sheets Setup ----------------
 SHEET_NAME = "Jobs_listings"  # Your sheet name
-scope = ["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"]
-
-creds = Credentials.from_service_account_file(
-    r"D:\Linkedin\selenium\service_account.json",  # Change to your path
-    scopes=scope
-)
-client = gspread.authorize(creds)
-
-# Function to fetch data fresh from Google Sheets
-def load_data():
-    try:
-        sheet = client.open(SHEET_NAME).sheet1
-        data = sheet.get_all_records()
-        df = pd.DataFrame(data)
-
-        # Normalize column names
-        df.columns = df.columns.str.strip().str.lower()
-        df.rename(columns={
-            "job postings": "job_postings",
-            "company": "company",
-            "place": "place",
-            "status": "status",
-            "posted on": "posted_on",
-            "url link": "url_link",
-            "job_description": "job_description"
-        }, inplace=True)
-
-        return df
-    except Exception as e:
-        print(f"Error loading data: {e}")
-        return pd.DataFrame()
+TEXT_COLUMNS = ("job_postings", "url_link", "job_description")
+TABLE_COLUMNS = ["job_postings", "company", "place", "status", "posted_on", "url_link"]
+client = get_client()
 
 # ---------------- Dash App ----------------
 app = dash.Dash(__name__, suppress_callback_exceptions=True)  # Handle dynamic components
 app.title = "Job Postings Dashboard"
 
+# In-process cache so filter changes don't re-download the sheet
+cache = Cache(app.server, config={"CACHE_TYPE": "SimpleCache"})
+CACHE_TIMEOUT = 300  # seconds
+
+# Last downloaded sheet revision + its DataFrame (reused while the sheet is unchanged)
+_last_revision = None
+_cached_df = pd.DataFrame()
+
+# Spreadsheet handle, opened once (opening by name is a Drive search + metadata fetch)
+@functools.lru_cache(maxsize=None)
+def open_spreadsheet(sheet_name):
+    return client.open(sheet_name)
+
+# Function to fetch data from Google Sheets (cached for CACHE_TIMEOUT seconds)
+@cache.memoize(timeout=CACHE_TIMEOUT)
+def load_data(sheet_name=SHEET_NAME):
+    # Errors propagate (load_store handles them) so a failed fetch is never memoized
+    global _last_revision, _cached_df
+    spreadsheet = open_spreadsheet(sheet_name)
+
+    # Only download the cell values if the sheet changed since the last fetch
+    revision = (sheet_name, get_modified_time(spreadsheet.id))
+    if revision == _last_revision:
+        return _cached_df
+
+    # One batched request returning the raw 2D grid (header row first)
+    values = get_sheet_values(spreadsheet)
+    if not values:
+        return pd.DataFrame()
+    df = pd.DataFrame(values[1:], columns=values[0])
+
+    # Normalize column names
+    df.columns = df.columns.str.strip().str.lower()
+    df.rename(columns={
+        "job postings": "job_postings",
+        "company": "company",
+        "place": "place",
+        "status": "status",
+        "posted on": "posted_on",
+        "url link": "url_link",
+        "job_description": "job_description"
+    }, inplace=True)
+
+    # Arrow-backed strings: str.* ops run in Arrow's C++ kernels
+    for c in TEXT_COLUMNS:
+        if c in df:
+            df[c] = df[c].fillna("").astype("string[pyarrow]")
+
+    # Pre-split descriptions into drawer bullet points once per load
+    if "job_description" in df:
+        df["desc_bullets"] = (
+            df["job_description"].fillna("").str.replace("\n", " ", regex=False)
+            .str.strip().str.split(r"\s*,\s*", regex=True)
+        )
+
+    _last_revision, _cached_df = revision, df
+    return df
+
 # ---------------- Layout ----------------
 app.layout = html.Div([
+    dcc.Location(id="url"),
+    dcc.Store(id="data-store"),
+    dcc.Store(id="desc-store"),  # job description bullets, indexed by row id
+    dcc.Store(id="filtered-store"),
+
     html.H1("📊 Job Postings Dashboard", style={"textAlign": "center"}),
 
     # Filters
@@ -67,7 +104,9 @@ app.layout = html.Div([
             html.Label("Search Keywords (comma separated)"),
             dcc.Input(id="keyword-filter", type="text", placeholder="e.g. AWS, Python, Java",
                       style={"width": "100%"})
-        ], style={"width": "29%", "display": "inline-block"})
+        ], style={"width": "29%", "display": "inline-block"}),
+
+        html.Button("🔄 Refresh", id="refresh-button", n_clicks=0, style={"marginTop": "10px"})
     ], style={"margin": "20px"}),
 
     html.Hr(),
@@ -75,8 +114,7 @@ app.layout = html.Div([
     # DataTable
     dash_table.DataTable(
         id="data-table",
-        columns=[{"name": c.replace('_', ' ').title(), "id": c} for c in
-                 ["job_postings", "company", "place", "status", "posted_on", "url_link"]],
+        columns=[{"name": c.replace('_', ' ').title(), "id": c} for c in TABLE_COLUMNS],
         data=[],
         row_selectable="single",
         filter_action="native",
@@ -108,99 +146,106 @@ app.layout = html.Div([
 
 # ---------------- Callbacks ----------------
 
-# Update filters + table
+# Dropdown options from the distinct values of a column in the store records
+def column_options(data, column):
+    values = {row.get(column) for row in data} - {None}
+    return [{"label": v, "value": v} for v in sorted(values)]
+
+# Load sheet data into the browser-side stores (page load + Refresh)
+@app.callback(
+    Output("data-store", "data"),
+    Output("desc-store", "data"),
+    Input("url", "pathname"),
+    Input("refresh-button", "n_clicks")
+)
+def load_store(pathname, refresh_clicks):
+    global _last_revision
+    # Refresh button bypasses both caches and re-downloads the sheet
+    # (Drive's modifiedTime can lag behind recent Sheets edits)
+    if ctx.triggered_id == "refresh-button":
+        cache.delete_memoized(load_data)
+        _last_revision = None
+    try:
+        df = load_data()
+    except Exception as e:
+        print(f"Error loading data: {e}")
+        return [], []
+
+    # Table rows carry a row id instead of the (large) description text;
+    # descriptions go to desc-store as the bullet lists split in load_data
+    records = df[df.columns.intersection(TABLE_COLUMNS)].assign(id=np.arange(len(df)))
+    bullets = [list(parts) for parts in df["desc_bullets"]] if "desc_bullets" in df else []
+    return records.to_dict("records"), bullets
+
+# Populate filter dropdowns (only when the data changes)
 @app.callback(
     Output("company-filter", "options"),
     Output("place-filter", "options"),
     Output("status-filter", "options"),
-    Output("data-table", "data"),
+    Input("data-store", "data")
+)
+def update_options(data):
+    # Handle empty data case
+    if not data:
+        return [], [], []
+
+    return tuple(column_options(data, c) for c in ("company", "place", "status"))
+
+# Apply dropdown filters (keyword filtering happens in the browser)
+@app.callback(
+    Output("filtered-store", "data"),
+    Input("data-store", "data"),
     Input("company-filter", "value"),
     Input("place-filter", "value"),
-    Input("status-filter", "value"),
-    Input("keyword-filter", "value")
+    Input("status-filter", "value")
 )
-def update_table(companies, places, statuses, keywords):
-    df = load_data()
+def update_table(data, companies, places, statuses):
+    df = pd.DataFrame(data)
 
     # Handle empty DataFrame case
     if df.empty:
-        return [], [], [], []
+        return []
 
-    # Populate filter dropdowns dynamically
-    company_options = [{"label": c, "value": c} for c in sorted(df["company"].dropna().unique())]
-    place_options = [{"label": p, "value": p} for p in sorted(df["place"].dropna().unique())]
-    status_options = [{"label": s, "value": s} for s in sorted(df["status"].dropna().unique())]  # Fixed typo here
-
-    # Apply filters
-    filtered_df = df.copy()
+    # Apply filters (combine masks, index once)
+    mask = np.ones(len(df), dtype=bool)
     if companies:
-        filtered_df = filtered_df[filtered_df["company"].isin(companies)]
+        mask &= df["company"].isin(companies).to_numpy()
     if places:
-        filtered_df = filtered_df[filtered_df["place"].isin(places)]
+        mask &= df["place"].isin(places).to_numpy()
     if statuses:
-        filtered_df = filtered_df[filtered_df["status"].isin(statuses)]
-    if keywords:
-        terms = [k.strip().lower() for k in keywords.split(",") if k.strip()]
-        mask = filtered_df["job_description"].fillna("").str.lower().apply(
-            lambda text: any(term in text for term in terms)
-        )
-        filtered_df = filtered_df[mask]
+        mask &= df["status"].isin(statuses).to_numpy()
+    filtered_df = df.loc[mask]
 
-    return company_options, place_options, status_options, filtered_df.to_dict("records")
+    return filtered_df.to_dict("records")
 
-# Drawer Display
-@app.callback(
+# Keyword filter + table update (clientside, see assets/filters.js)
+app.clientside_callback(
+    ClientsideFunction(namespace="filters", function_name="applyKeyword"),
+    Output("data-table", "data"),
+    Input("keyword-filter", "value"),
+    Input("filtered-store", "data"),
+    State("desc-store", "data")
+)
+
+# Drawer Display (clientside, see assets/drawer.js)
+app.clientside_callback(
+    ClientsideFunction(namespace="drawer", function_name="display"),
     Output("drawer", "style"),
     Output("drawer", "children"),
     Input("data-table", "selected_rows"),
     State("data-table", "data"),
+    State("desc-store", "data"),
     State("drawer", "style")
 )
-def display_drawer(selected_rows, table_data, drawer_style):
-    if not selected_rows or not table_data:
-        return {**drawer_style, "right": "-40%"}, []
-
-    row = table_data[selected_rows[0]]
-
-    # Format job description into bullet points
-    description = row.get("job_description", "No description available")
-    if description and description.strip():
-        bullets = [html.Li(part.strip()) for part in description.replace("\n", " ").split(",") if part.strip()]
-        desc_content = html.Ul(bullets)
-    else:
-        desc_content = html.P("No description available.")
-
-    content = html.Div([
-        html.Button("❌ Close", id="close-drawer", style={
-            "float": "right", "background": "red", "color": "white", "border": "none",
-            "padding": "5px 10px", "cursor": "pointer", "borderRadius": "5px"
-        }),
-
-        html.H2(row.get("job_postings", "N/A"), style={"marginTop": "0px"}),
-        html.P(f"📌 Company: {row.get('company', 'N/A')}", style={"fontWeight": "bold"}),
-        html.P(f"📍 Location: {row.get('place', 'N/A')}"),
-        html.P(f"📝 Status: {row.get('status', 'N/A')}"),
-        html.P(f"📅 Posted On: {row.get('posted_on', 'N/A')}"),
-        html.A("🔗 View Job Posting", href=row.get("url_link", "#"),
-               target="_blank", style={"color": "blue", "textDecoration": "underline"}),
-
-        html.H3("📄 Job Description", style={"marginTop": "20px", "borderBottom": "1px solid #ddd"}),
-        desc_content
-    ])
-
-    return {**drawer_style, "right": "0%"}, content
-
-# Close Drawer
-@app.callback(
+
+# Close Drawer (clientside)
+app.clientside_callback(
+    ClientsideFunction(namespace="drawer", function_name="close"),
     Output("drawer", "style", allow_duplicate=True),
     Input("close-drawer", "n_clicks"),
     State("drawer", "style"),
     prevent_initial_call=True
 )
-def close_drawer(n_clicks, drawer_style):
-    if n_clicks:
-        return {**drawer_style, "right": "-40%"}
-    return drawer_style
 
 # Run app
 if __name__ == "__main__":
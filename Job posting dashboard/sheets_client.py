@@ -0,0 +1,51 @@
+import functools
+
+import gspread
+from google.auth.transport.requests import AuthorizedSession
+from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
+
+# ---------------- Google Sheets Setup ----------------
+SERVICE_ACCOUNT_FILE = r"D:\Linkedin\selenium\service_account.json"  # Change to your path
+scope = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive"
+]
+
+DRIVE_FILE_URL = "https://www.googleapis.com/drive/v3/files/{}"
+SHEET_RANGE = "A:G"  # No tab name: reads the first visible tab (like .sheet1)
+
+# Shared authorized session (credentials parsed once per process)
+@functools.lru_cache(maxsize=1)
+def get_session():
+    creds = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=scope)
+
+    # Pooled session keeps TLS connections warm for repeat fetches
+    session = AuthorizedSession(creds)
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return session
+
+# Shared gspread client on top of the pooled session
+@functools.lru_cache(maxsize=1)
+def get_client():
+    session = get_session()
+    return gspread.Client(session.credentials, session=session)
+
+# Last-modified time of a Drive file (spreadsheet) - a tiny metadata request
+def get_modified_time(file_id):
+    response = get_session().get(
+        DRIVE_FILE_URL.format(file_id),
+        params={"fields": "modifiedTime", "supportsAllDrives": "true"}
+    )
+    response.raise_for_status()
+    return response.json()["modifiedTime"]
+
+# Cell values of the first tab in one batched request. values.batchGet drops
+# trailing blank cells, so rows are padded (or truncated) to the header width.
+def get_sheet_values(spreadsheet):
+    response = spreadsheet.values_batch_get(ranges=[SHEET_RANGE])
+    values = response["valueRanges"][0].get("values", [])
+    if not values:
+        return []
+    width = len(values[0])
+    return [values[0]] + [(row + [""] * width)[:width] for row in values[1:]]
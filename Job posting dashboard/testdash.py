@@ -1,37 +1,28 @@
 import gspread
-from google.oauth2.service_account import Credentials
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # Render straight to files, no GUI backend
 import matplotlib.pyplot as plt
-from datetime import datetime, timedelta
+from datetime import datetime
 import os
+from sheets_client import get_client, get_sheet_values
 
-# Define scope
-scope = [
-    "https://www.googleapis.com/auth/spreadsheets",
-    "https://www.googleapis.com/auth/drive"
-]
-
-# Load credentials (update the path to your service account JSON file if needed)
+# Shared Google Sheets client (update the service account path in sheets_client.py if needed)
 try:
-    creds = Credentials.from_service_account_file(
-        r"D:\Linkedin\selenium\service_account.json", scopes=scope
-    )
+    client = get_client()
 except FileNotFoundError:
     print("Error: Service account JSON file not found. Please check the file path.")
     exit()
 
-# Authorize
-client = gspread.authorize(creds)
-
 # Open Google Sheet
 try:
-    sheet = client.open("Jobs_listings").sheet1
+    spreadsheet = client.open("Jobs_listings")
 except gspread.exceptions.SpreadsheetNotFound:
     print("Error: Google Sheet 'Jobs_listings' not found. Please verify the sheet name.")
     exit()
 
-# Get all data from the sheet
-data = sheet.get_all_values()
+# Get all data from the sheet in a single batched request
+data = get_sheet_values(spreadsheet)
 
 # Convert to pandas DataFrame
 if not data or len(data) < 2:
@@ -72,34 +63,37 @@ if missing_cols:
     print(f"Error: Missing critical columns: {missing_cols}. Please check the sheet headers.")
     exit()
 
-# Function to parse relative dates like "1 month ago"
-def parse_relative_date(date_str, reference_date=None):
+# Arrow-backed strings: str.* ops below run in Arrow's C++ kernels
+for col in ('job_postings', 'company', 'place', 'status', 'url_link'):
+    df[col] = df[col].fillna('').astype('string[pyarrow]')
+
+# Days per unit for relative dates like "1 month ago"
+RELATIVE_UNIT_DAYS = {'day': 1, 'week': 7, 'month': 30}
+
+# Function to parse a column of relative dates like "1 month ago" (vectorized)
+def parse_relative_dates(dates, reference_date=None):
     if reference_date is None:
         reference_date = datetime(2025, 9, 5)  # Current date as per system
-    try:
-        if 'ago' in date_str.lower():
-            if 'month' in date_str.lower():
-                months = int(date_str.split()[0])
-                return reference_date - timedelta(days=months * 30)
-            elif 'week' in date_str.lower():
-                weeks = int(date_str.split()[0])
-                return reference_date - timedelta(weeks=weeks)
-            elif 'day' in date_str.lower():
-                days = int(date_str.split()[0])
-                return reference_date - timedelta(days=days)
-        return pd.to_datetime(date_str)
-    except (ValueError, TypeError):
-        return pd.NaT
+    parts = dates.str.extract(r'(?i)(\d+)\s*(day|week|month)s?\s*ago')
+    days = parts[0].astype(float) * parts[1].str.lower().map(RELATIVE_UNIT_DAYS)
+    relative = reference_date - pd.to_timedelta(days, unit='D')
+    # Anything that isn't "N units ago" is parsed as an absolute date
+    absolute = pd.to_datetime(dates[days.isna()], format='mixed', errors='coerce')  # per-value formats
+    return relative.fillna(absolute)
 
 # Clean and preprocess data
-df['posted_on'] = df['posted_on'].apply(parse_relative_date)
+df['posted_on'] = parse_relative_dates(df['posted_on'])
 df = df.dropna(subset=['posted_on'])  # Drop rows with invalid dates
 df['job_postings'] = df['job_postings'].str.strip()  # Clean job titles
 df['company'] = df['company'].str.strip()  # Clean company names
 df['place'] = df['place'].str.strip()  # Clean place names
 
 # Extract city from place (assuming format like "Bengaluru, Karnataka, India (Hybrid)")
-df['city'] = df['place'].str.split(',').str[0].str.strip()
+df['city'] = df['place'].str.extract(r'^\s*([^,]+?)\s*(?:,|$)', expand=False)
+
+# Store repetitive columns as categories (int codes + one copy of each string)
+for col in ('company', 'place', 'status', 'city'):
+    df[col] = df[col].astype('category')
 
 # Compute insights
 total_postings = len(df)
@@ -110,64 +104,49 @@ top_companies = df['company'].value_counts().head(5)
 top_places = df['place'].value_counts().head(5)
 city_counts = df['city'].value_counts().head(5)
 
-# Group by month for time-based trends
-df['month'] = df['posted_on'].dt.to_period('M')
-postings_by_month = df['month'].value_counts().sort_index()
+# Group by month for time-based trends (month-start bins on the datetime column)
+postings_by_month = df.set_index('posted_on').resample('MS').size()
 
 # Create output directory for plots
 output_dir = "job_postings_plots"
 os.makedirs(output_dir, exist_ok=True)
 
+# One figure reused for every plot (axes rebuilt each time so pie settings don't leak)
+fig = plt.figure(figsize=(10, 6))
+
+def save_plot(kind, data, title, color, filename, xlabel=None):
+    fig.clf()
+    ax = fig.add_subplot()
+    if kind == 'pie':
+        fig.set_size_inches(8, 6)
+        ax.pie(data, labels=data.index, autopct='%1.1f%%', colors=color)
+        ax.set_title(title)
+    else:
+        fig.set_size_inches(10, 6)
+        data.plot(kind=kind, ax=ax, color=color, **({'marker': 'o'} if kind == 'line' else {}))
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel("Number of Postings")
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right' if kind == 'bar' else 'center')
+        fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, filename))
+
 # Visualization 1: Status Distribution (Pie Chart)
-plt.figure(figsize=(8, 6))
-plt.pie(status_counts, labels=status_counts.index, autopct='%1.1f%%', colors=['#FF9999', '#66B2FF', '#99FF99', '#FFCC99'])
-plt.title("Job Status Distribution")
-plt.savefig(os.path.join(output_dir, "status_distribution.png"))
-plt.close()
+save_plot('pie', status_counts, "Job Status Distribution", ['#FF9999', '#66B2FF', '#99FF99', '#FFCC99'], "status_distribution.png")
 
 # Visualization 2: Top 5 Companies (Bar Plot)
-plt.figure(figsize=(10, 6))
-top_companies.plot(kind='bar', color='#636EFA')
-plt.title("Top 5 Companies by Job Postings")
-plt.xlabel("Company")
-plt.ylabel("Number of Postings")
-plt.xticks(rotation=45, ha='right')
-plt.tight_layout()
-plt.savefig(os.path.join(output_dir, "top_companies.png"))
-plt.close()
+save_plot('bar', top_companies, "Top 5 Companies by Job Postings", '#636EFA', "top_companies.png", xlabel="Company")
 
 # Visualization 3: Top 5 Locations (Bar Plot)
-plt.figure(figsize=(10, 6))
-top_places.plot(kind='bar', color='#EF553B')
-plt.title("Top 5 Locations by Job Postings")
-plt.xlabel("Location")
-plt.ylabel("Number of Postings")
-plt.xticks(rotation=45, ha='right')
-plt.tight_layout()
-plt.savefig(os.path.join(output_dir, "top_locations.png"))
-plt.close()
+save_plot('bar', top_places, "Top 5 Locations by Job Postings", '#EF553B', "top_locations.png", xlabel="Location")
 
 # Visualization 4: Top 5 Cities (Bar Plot)
-plt.figure(figsize=(10, 6))
-city_counts.plot(kind='bar', color='#AB63FA')
-plt.title("Top 5 Cities by Job Postings")
-plt.xlabel("City")
-plt.ylabel("Number of Postings")
-plt.xticks(rotation=45, ha='right')
-plt.tight_layout()
-plt.savefig(os.path.join(output_dir, "top_cities.png"))
-plt.close()
+save_plot('bar', city_counts, "Top 5 Cities by Job Postings", '#AB63FA', "top_cities.png", xlabel="City")
 
 # Visualization 5: Postings Over Time (Line Plot)
-plt.figure(figsize=(10, 6))
-postings_by_month.plot(kind='line', marker='o', color='#00CC96')
-plt.title("Monthly Job Postings Trend")
-plt.xlabel("Month")
-plt.ylabel("Number of Postings")
-plt.xticks(rotation=45)
-plt.tight_layout()
-plt.savefig(os.path.join(output_dir, "monthly_trend.png"))
-plt.close()
+save_plot('line', postings_by_month, "Monthly Job Postings Trend", '#00CC96', "monthly_trend.png", xlabel="Month")
+
+plt.close(fig)
 
 # Print Key Metrics
 print("\n=== Key Metrics ===")
@@ -202,7 +181,7 @@ Based on the job postings data, here are actionable insights for client enrichme
    - Postings with statuses like "{sample_row.get('status', 'N/A')}" indicate active hiring. Create automated alerts for clients when new postings with "Actively reviewing applicants" appear, ensuring timely applications.
 
 5. **Temporal Trends**: 
-   - Group postings by 'posted on' to identify peak hiring months. For example, if recent postings cluster in {sample_row.get('month', 'N/A').strftime('%B %Y') if not df.empty else 'N/A'}, schedule engagement campaigns (e.g., email blasts, LinkedIn ads) during these periods.
+   - Group postings by 'posted on' to identify peak hiring months. For example, if recent postings cluster in {sample_row.get('posted_on').strftime('%B %Y') if not df.empty else 'N/A'}, schedule engagement campaigns (e.g., email blasts, LinkedIn ads) during these periods.
 
 6. **URL Link Analysis**: 
    - Most URLs point to LinkedIn (e.g., "{sample_row.get('url_link', 'N/A')}"). Analyze domain frequency to prioritize job board partnerships or advertising on platforms like LinkedIn for better client visibility.
@@ -1,37 +1,29 @@
 import gspread
-from google.oauth2.service_account import Credentials
 import pandas as pd
 import plotly.express as px
-from dash import Dash, dcc, html, Input, Output
+from dash import Dash, dcc, html, Input, Output, State
 from dash.dash_table import DataTable
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 import os
+from sheets_client import get_client, get_sheet_values
 
-# Define API scopes
-scope = [
-    "https://www.googleapis.com/auth/spreadsheets",
-    "https://www.googleapis.com/auth/drive"
-]
-
-# Load credentials
+# Shared Google Sheets client
 try:
-    creds = Credentials.from_service_account_file(
-        r"D:\Linkedin\selenium\service_account.json", scopes=scope
-    )
+    client = get_client()
 except FileNotFoundError:
     print("❌ Error: Service account JSON file not found. Please check the file path.")
     exit()
 
-# Authorize and open Google Sheet
-client = gspread.authorize(creds)
+# Open Google Sheet
 try:
-    sheet = client.open("Jobs_listings").sheet1
+    spreadsheet = client.open("Jobs_listings")
 except gspread.exceptions.SpreadsheetNotFound:
     print("❌ Error: Google Sheet 'Jobs_listings' not found. Please verify the sheet name.")
     exit()
 
-# Fetch sheet data
-data = sheet.get_all_values()
+# Fetch sheet data in a single batched request
+data = get_sheet_values(spreadsheet)
 if not data or len(data) < 2:
     print("❌ Error: The Google Sheet is empty or has no data rows.")
     exit()
@@ -57,67 +49,113 @@ if missing_cols:
     print(f"❌ Missing critical columns: {missing_cols}. Please check sheet headers.")
     exit()
 
-# Function to parse dates like "2 weeks ago"
-def parse_relative_date(date_str, reference_date=None):
+# Arrow-backed strings for the text columns
+for col in ('job_postings', 'company', 'place', 'status', 'url_link'):
+    df[col] = df[col].fillna('').astype('string[pyarrow]')
+
+# Days per unit for relative dates like "2 weeks ago"
+RELATIVE_UNIT_DAYS = {"day": 1, "week": 7, "month": 30}
+
+# Function to parse a column of dates like "2 weeks ago" (vectorized)
+def parse_relative_dates(dates, reference_date=None):
     if reference_date is None:
         reference_date = datetime.now()
-    try:
-        s = date_str.lower()
-        if "ago" in s:
-            if "month" in s:
-                months = int(s.split()[0])
-                return reference_date - timedelta(days=months * 30)
-            elif "week" in s:
-                weeks = int(s.split()[0])
-                return reference_date - timedelta(weeks=weeks)
-            elif "day" in s:
-                days = int(s.split()[0])
-                return reference_date - timedelta(days=days)
-        return pd.to_datetime(date_str, errors="coerce")
-    except Exception:
-        return pd.NaT
+    parts = dates.str.extract(r"(?i)(\d+)\s*(day|week|month)s?\s*ago")
+    days = parts[0].astype(float) * parts[1].str.lower().map(RELATIVE_UNIT_DAYS)
+    relative = reference_date - pd.to_timedelta(days, unit="D")
+    # Anything that isn't "N units ago" is parsed as an absolute date
+    absolute = pd.to_datetime(dates[days.isna()], format="mixed", errors="coerce")  # per-value formats
+    return relative.fillna(absolute)
 
 # Clean data
-df['posted_on'] = df['posted_on'].apply(parse_relative_date)
+df['posted_on'] = parse_relative_dates(df['posted_on'])
 df = df.dropna(subset=['posted_on'])
 df['job_postings'] = df['job_postings'].str.strip()
 df['company'] = df['company'].str.strip()
 df['place'] = df['place'].str.strip()
-df['city'] = df['place'].str.split(',').str[0].str.strip()
+df['city'] = df['place'].str.extract(r'^\s*([^,]+?)\s*(?:,|$)', expand=False)
+for col in ('company', 'place', 'status', 'city'):
+    df[col] = df[col].astype('category')  # repetitive strings -> int codes
 df = df.sort_values(by='posted_on', ascending=False)
 
 # Initialize Dash
 app = Dash(__name__)
 
+# Count postings per value (categorical columns also list unused categories, so drop zeros)
+def count_by(filtered_df, column, top=None):
+    counts = filtered_df[column].value_counts()
+    counts = counts[counts > 0]
+    if top:
+        counts = counts.head(top)
+    counts = counts.reset_index()
+    counts.columns = [column, 'count']
+    return counts
+
 # Initial plots
 def make_figures(filtered_df):
-    status_counts = filtered_df['status'].value_counts().reset_index()
-    status_counts.columns = ['status', 'count']
-
-    top_companies = filtered_df['company'].value_counts().head(5).reset_index()
-    top_companies.columns = ['company', 'count']
-
-    top_places = filtered_df['place'].value_counts().head(5).reset_index()
-    top_places.columns = ['place', 'count']
-
-    city_counts = filtered_df['city'].value_counts().head(5).reset_index()
-    city_counts.columns = ['city', 'count']
+    status_counts = count_by(filtered_df, 'status')
+    top_companies = count_by(filtered_df, 'company', top=5)
+    top_places = count_by(filtered_df, 'place', top=5)
+    city_counts = count_by(filtered_df, 'city', top=5)
 
     postings_by_month = (
-        filtered_df.groupby(filtered_df['posted_on'].dt.to_period('M'))
+        filtered_df.set_index('posted_on')
+        .resample('MS')
         .size()
         .reset_index(name="count")
     )
-    postings_by_month['posted_on'] = postings_by_month['posted_on'].astype(str)
+    fig_time = px.line(postings_by_month, x="posted_on", y="count", title="Monthly Job Postings Trend")
+    fig_time.update_xaxes(tickformat="%b %Y")
 
     return (
         px.pie(status_counts, values="count", names="status", title="Job Status Distribution"),
         px.bar(top_companies, x="company", y="count", title="Top 5 Companies"),
         px.bar(top_places, x="place", y="count", title="Top 5 Locations"),
         px.bar(city_counts, x="city", y="count", title="Top 5 Cities"),
-        px.line(postings_by_month, x="posted_on", y="count", title="Monthly Job Postings Trend")
+        fig_time
     )
 
+# Filter postings by keyword in the job title
+def filter_postings(keyword):
+    if not keyword:
+        return df
+    # Plain substring match: no regex to compile per call
+    return df[df["job_postings"].str.contains(keyword, case=False, regex=False, na=False)]
+
+# Columns shown in the data table (only these are serialized)
+TABLE_COLUMNS = ["job_postings", "company", "place", "status", "posted_on", "url_link"]
+
+def table_records(filtered_df):
+    return filtered_df[TABLE_COLUMNS].to_dict("records")
+
+# Filtered rows, figures and table rows per (lowercased) keyword, cached so a
+# keyword is filtered once and repeated filters skip the rebuild entirely
+@lru_cache(maxsize=128)
+def keyword_view(keyword):
+    filtered_df = filter_postings(keyword)
+    return filtered_df, make_figures(filtered_df), table_records(filtered_df)
+
+# Figures + table rows for the unfiltered data (the common initial state)
+BASE_FIGURES = make_figures(df)
+BASE_RECORDS = table_records(df)
+
+def make_metrics(filtered_df):
+    return [
+        html.Div(f"Total Postings: {len(filtered_df)}"),
+        html.Div(f"Unique Companies: {filtered_df['company'].nunique()}"),
+        html.Div(f"Unique Locations: {filtered_df['place'].nunique()}"),
+    ]
+
+def make_insights(filtered_df):
+    sample_row = filtered_df.iloc[0] if not filtered_df.empty else {}
+    return f"""
+    - **Location**: {sample_row.get('place', 'N/A')}
+    - **Company**: {sample_row.get('company', 'N/A')}
+    - **Role**: {sample_row.get('job_postings', 'N/A')}
+    - **Status**: {sample_row.get('status', 'N/A')}
+    - **Posted On**: {sample_row.get('posted_on').strftime('%B %Y') if pd.notna(sample_row.get('posted_on', None)) else 'N/A'}
+    """
+
 # Dashboard layout
 app.layout = html.Div([
     html.H1("Job Postings Dashboard"),
@@ -137,8 +175,8 @@ app.layout = html.Div([
     html.H2("Job Postings Data"),
     DataTable(
         id="data-table",
-        columns=[{"name": col, "id": col} for col in ["job_postings", "company", "place", "status", "posted_on", "url_link"]],
-        data=df.to_dict("records"),
+        columns=[{"name": col, "id": col} for col in TABLE_COLUMNS],
+        data=BASE_RECORDS,
         page_size=10,
         style_table={"overflowX": "auto"},
         style_cell={"textAlign": "left"},
@@ -161,31 +199,15 @@ app.layout = html.Div([
         Output("insights-text", "children")
     ],
     [Input("filter-button", "n_clicks")],
-    [Input("keyword-input", "value")]
+    [State("keyword-input", "value")],  # only "Apply Filter" triggers, not every keystroke
+    prevent_initial_call=False  # initial load (n_clicks == 0) renders the unfiltered view
 )
 def update_dashboard(n_clicks, keyword):
-    filtered_df = df
-    if keyword:
-        filtered_df = df[df["job_postings"].str.contains(keyword, case=False, na=False)]
-
-    fig_status, fig_companies, fig_places, fig_cities, fig_time = make_figures(filtered_df)
-
-    metrics = [
-        html.Div(f"Total Postings: {len(filtered_df)}"),
-        html.Div(f"Unique Companies: {filtered_df['company'].nunique()}"),
-        html.Div(f"Unique Locations: {filtered_df['place'].nunique()}"),
-    ]
-
-    sample_row = filtered_df.iloc[0] if not filtered_df.empty else {}
-    insights = f"""
-    - **Location**: {sample_row.get('place', 'N/A')}
-    - **Company**: {sample_row.get('company', 'N/A')}
-    - **Role**: {sample_row.get('job_postings', 'N/A')}
-    - **Status**: {sample_row.get('status', 'N/A')}
-    - **Posted On**: {sample_row.get('posted_on').strftime('%B %Y') if pd.notna(sample_row.get('posted_on', None)) else 'N/A'}
-    """
+    if not keyword:
+        return make_metrics(df), *BASE_FIGURES, BASE_RECORDS, make_insights(df)
 
-    return metrics, fig_status, fig_companies, fig_places, fig_cities, fig_time, filtered_df.to_dict("records"), insights
+    filtered_df, figures, records = keyword_view(keyword.lower())
+    return make_metrics(filtered_df), *figures, records, make_insights(filtered_df)
 
 if __name__ == "__main__":
     app.run(debug=True)